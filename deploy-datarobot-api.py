@@ -11,13 +11,6 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-try:
-    import datarobot as dr
-except ImportError:
-    print("Installing DataRobot Python client...")
-    os.system("pip install datarobot")
-    import datarobot as dr
-
 def main():
     print("=== DataRobot Custom Application Deployment ===\n")
 
@@ -33,6 +26,14 @@ def main():
         print("  DATAROBOT_API_TOKEN=your-token-here")
         sys.exit(1)
 
+    try:
+        import datarobot as dr
+    except ImportError:
+        print("Error: DataRobot Python client is not installed.")
+        print("Install it with:")
+        print("  pip install datarobot")
+        sys.exit(1)
+
     # Initialize DataRobot client
     dr.Client(token=api_token, endpoint=endpoint)
     print(f"✓ Connected to DataRobot at {endpoint}\n")
@@ -3,13 +3,15 @@ Simple proxy server for MCP that adds Bearer token authentication.
 Forwards requests to the DataRobot MCP server with authentication.
 """
 import argparse
+import json
 import logging
 import os
 
 import dotenv
 from starlette.applications import Starlette
+from starlette.background import BackgroundTask
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response, StreamingResponse
 import uvicorn
 import httpx
 
@@ -17,63 +19,113 @@ logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
+# The format doesn't use thread/process fields, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger("mcp_proxy_server")
 
-# Load environment variables
-dotenv.load_dotenv()
+# Load environment variables once; worker processes inherit them
+if not os.getenv("_DOTENV_LOADED"):
+    dotenv.load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 # Target MCP server configuration
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:8080")
 BEARER_TOKEN = os.getenv("BEARER_TOKEN", "")
+BEARER_HEADER = f"Bearer {BEARER_TOKEN}"
+
+# Methods forwarded to the MCP server
+PROXY_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH"]
+
+# OPTIONS is answered locally without a round trip to the MCP server
+_OPTIONS_RESPONSE = Response(status_code=204, headers={"Allow": ",".join(PROXY_METHODS)})
+
+# Error body template; only the JSON-escaped message is formatted in per error
+_ERROR_BODY = b'{"error": "Proxy error: %s"}'
+
+# Response headers not forwarded to the client
+_DROP_RESPONSE_HEADERS = frozenset({b"content-length", b"transfer-encoding"})
+
+# Upstream origin as it appears in redirect Locations, rewritten to the proxy's own origin
+_UPSTREAM_ORIGIN = MCP_SERVER_URL.rstrip("/").encode()
+
+# Shared HTTP client so connections to the MCP server are pooled across requests.
+# HTTP/2 lets concurrent requests multiplex over one connection to an https backend.
+# Pool settings live on the transport, which the client uses instead of its own.
+# Redirects are followed per request in proxy_handler: only bodyless requests can be
+# replayed to a new location, since a request body is streamed through once.
+_TRANSPORT = httpx.AsyncHTTPTransport(
+    http2=True,
+    limits=httpx.Limits(max_connections=500, max_keepalive_connections=200, keepalive_expiry=60.0),
+    retries=1,
+)
+_CLIENT = httpx.AsyncClient(
+    timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0),
+    follow_redirects=False,
+    transport=_TRANSPORT,
+)
+
+
+def _proxy_location(location: bytes, request: Request) -> bytes:
+    """Point a redirect at the MCP server back through the proxy, so clients keep the Bearer token."""
+    if location.startswith(_UPSTREAM_ORIGIN):
+        return str(request.base_url).rstrip("/").encode() + location[len(_UPSTREAM_ORIGIN):]
+    return location
 
 
 async def proxy_handler(request: Request) -> Response:
     """Forward requests to MCP server with Bearer token."""
-    try:
-        # Get the request body
-        body = await request.body()
+    if request.method == "OPTIONS":
+        return _OPTIONS_RESPONSE
 
-        # Copy all original headers
-        headers = dict(request.headers)
+    try:
+        # Copy all original headers straight from the raw ASGI header list
+        headers = httpx.Headers(request.headers.raw)
 
         # Remove host header (will be set by httpx for target)
         headers.pop("host", None)
 
         # Add/Override Authorization header with Bearer token
-        headers["Authorization"] = f"Bearer {BEARER_TOKEN}"
-
-        # Forward the request to the MCP server
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            target_url = f"{MCP_SERVER_URL}{request.url.path}"
-            logger.info(f"Forwarding request to: {target_url}")
-
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=headers,
-                content=body,
-                params=request.query_params,
-            )
-
-            # Copy response headers
-            response_headers = dict(response.headers)
-
-            # Remove headers that might cause issues
-            response_headers.pop("content-encoding", None)
-            response_headers.pop("content-length", None)
-            response_headers.pop("transfer-encoding", None)
-
-            # Return the response from MCP server
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=response_headers,
-            )
+        headers["Authorization"] = BEARER_HEADER
+
+        # Forward the request to the MCP server, streaming the body through
+        target_url = f"{MCP_SERVER_URL}{request.url.path}"
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Forwarding request to: %s", target_url)
+
+        # Only requests that declare a body have one to stream; this holds for any method
+        has_body = "content-length" in headers or "transfer-encoding" in headers
+        upstream_request = _CLIENT.build_request(
+            method=request.method,
+            url=target_url,
+            headers=headers,
+            content=request.stream() if has_body else b"",
+            params=request.query_params,
+        )
+        upstream = await _CLIENT.send(upstream_request, stream=True, follow_redirects=not has_body)
+
+        # Relay the response from MCP server chunk by chunk
+        response = StreamingResponse(
+            upstream.aiter_raw(),
+            status_code=upstream.status_code,
+            background=BackgroundTask(upstream.aclose),
+        )
+
+        # Pass upstream headers through as raw bytes, minus framing headers; the body is
+        # re-chunked on the way out. content-encoding is kept because the raw (still
+        # encoded) bytes are relayed.
+        response.raw_headers = [
+            (k, _proxy_location(v, request) if k.lower() == b"location" else v)
+            for k, v in upstream.headers.raw
+            if k.lower() not in _DROP_RESPONSE_HEADERS
+        ]
+        return response
 
     except Exception as e:
-        logger.error(f"Error proxying request: {e}")
+        logger.error("Error proxying request: %s", e)
         return Response(
-            content=f'{{"error": "Proxy error: {str(e)}"}}',
+            content=_ERROR_BODY % json.dumps(str(e))[1:-1].encode(),
             status_code=500,
             media_type="application/json",
         )
@@ -87,17 +139,41 @@ async def health_check(request: Request) -> Response:
     )
 
 
+async def metrics(request: Request) -> Response:
+    """Connection pool metrics for the proxy's upstream client."""
+    return JSONResponse({"upstream_connections": len(_TRANSPORT._pool.connections)})
+
+
+async def shutdown():
+    """Close the shared HTTP client on shutdown."""
+    await _CLIENT.aclose()
+
+
+async def server_error_handler(request: Request, exc: Exception) -> Response:
+    """Render unhandled exceptions as a compact JSON error."""
+    logger.error("Unhandled error: %s", exc)
+    return Response(
+        content=_ERROR_BODY % json.dumps(str(exc))[1:-1].encode(),
+        status_code=500,
+        media_type="application/json",
+    )
+
+
 from starlette.routing import Route
 
 # Create Starlette app
 app = Starlette(
-    debug=True,
+    debug=os.getenv("MCP_DEBUG", "0") == "1",
+    exception_handlers={Exception: server_error_handler},
     routes=[
         # Health check
         Route("/health", health_check, methods=["GET"]),
+        # Proxy metrics (plain /metrics is forwarded to the MCP server)
+        Route("/proxy/metrics", metrics, methods=["GET"]),
         # Proxy all other requests
-        Route("/{path:path}", proxy_handler, methods=["GET", "POST", "PUT", "DELETE", "PATCH"]),
+        Route("/{path:path}", proxy_handler, methods=[*PROXY_METHODS, "HEAD", "OPTIONS"]),
     ],
+    on_shutdown=[shutdown],
 )
 
 
@@ -111,14 +187,20 @@ def main():
     if not BEARER_TOKEN:
         logger.warning("BEARER_TOKEN environment variable is not set!")
 
-    logger.info(f"Starting proxy server on {args.host}:{args.port}")
-    logger.info(f"Forwarding to MCP server: {MCP_SERVER_URL}")
+    logger.info("Starting proxy server on %s:%s", args.host, args.port)
+    logger.info("Forwarding to MCP server: %s", MCP_SERVER_URL)
+
+    # Multiple workers need the app as an import string so each process can load it
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
 
     uvicorn.run(
-        app,
+        app if workers == 1 else "proxy_server:app",
         host=args.host,
         port=args.port,
         log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
     )
 
 
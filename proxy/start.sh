@@ -2,7 +2,7 @@
 set -e
 
 echo "Installing dependencies..."
-pip install --no-cache-dir starlette uvicorn httpx python-dotenv
+pip install --no-cache-dir starlette uvicorn "httpx[http2]" python-dotenv uvloop httptools
 
 echo "Starting proxy server..."
 python /app/proxy_server.py --host 0.0.0.0 --port 8000
@@ -3,7 +3,6 @@ import asyncio
 import os
 
 import dotenv
-import snowflake.connector
 
 from . import server
 
@@ -74,12 +73,12 @@ def main():
 
     dotenv.load_dotenv()
 
+    import snowflake.connector
+
     default_connection_args = snowflake.connector.connection.DEFAULT_CONFIGURATION
 
     connection_args_from_env = {
-        k: os.getenv("SNOWFLAKE_" + k.upper())
-        for k in default_connection_args
-        if os.getenv("SNOWFLAKE_" + k.upper()) is not None
+        k: v for k in default_connection_args if (v := os.getenv("SNOWFLAKE_" + k.upper())) is not None
     }
 
     # Handle token authentication separately
@@ -2,9 +2,10 @@ import asyncio
 import logging
 import time
 import uuid
-from typing import Any
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Iterator
 
-from snowflake.snowpark import Session
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 # Configure logging
 logging.basicConfig(
@@ -15,30 +16,81 @@ logging.basicConfig(
 logger = logging.getLogger("mcp_snowflake_server")
 
 
+class _PooledSession:
+    """A Snowpark session with the bookkeeping the pool needs to recycle it"""
+
+    __slots__ = ("session", "created", "last_used")
+
+    def __init__(self, session):
+        self.session = session
+        self.created = self.last_used = time.monotonic()
+
+
 class SnowflakeDB:
     AUTH_EXPIRATION_TIME = 1800
+    # Sessions idle longer than this are pinged before reuse
+    PING_IDLE_SECONDS = 60
+    # Upper bound on distinct queries tracked for coalescing at once
+    MAX_INFLIGHT_KEYS = 1024
 
-    def __init__(self, connection_config: dict):
+    def __init__(self, connection_config: dict, max_concurrent_queries: int = 8, pool_size: int = 1):
         self.connection_config = connection_config
-        self.session = None
         self.insights: list[str] = []
-        self.auth_time = 0
         self.init_task = None  # To store the task reference
+        # Bound concurrent queries so bursts queue here instead of inside the driver/warehouse
+        self.max_concurrent_queries = max_concurrent_queries
+        self._query_semaphore = asyncio.Semaphore(max_concurrent_queries)
+        # Up to pool_size warm sessions are kept idle; bursts beyond that open overflow
+        # sessions (up to max_concurrent_queries in total) that are closed on release
+        self.pool_size = min(pool_size, max_concurrent_queries)
+        self._pool: asyncio.Queue[_PooledSession] = asyncio.Queue(maxsize=self.pool_size)
+        self._open_sessions = 0
+        # Set once any session has opened; a failed warmup leaves it unset until a query connects
+        self.connected = False
+        # Shared executions of identical read queries that are currently running
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _create_session(self) -> _PooledSession:
+        """Open a new Snowpark session (blocking)"""
+        # Snowpark is heavy to import; defer it until a connection is actually opened
+        from snowflake.snowpark import Session
 
-    async def _init_database(self):
-        """Initialize connection to the Snowflake database"""
         try:
             # Create session without setting specific database and schema
-            self.session = Session.builder.configs(self.connection_config).create()
+            session = Session.builder.configs(self.connection_config).create()
 
             # Set initial warehouse if provided, but don't set database or schema
             if "warehouse" in self.connection_config:
-                self.session.sql(f"USE WAREHOUSE {self.connection_config['warehouse'].upper()}")
+                session.sql(f"USE WAREHOUSE {self.connection_config['warehouse'].upper()}")
 
-            self.auth_time = time.time()
+            return _PooledSession(session)
         except Exception as e:
             raise ValueError(f"Failed to connect to Snowflake database: {e}")
 
+    async def _connect(self) -> _PooledSession:
+        """Open a session counted against the pool limit"""
+        self._open_sessions += 1
+        try:
+            # Session creation blocks on authentication, so keep it off the event loop
+            conn = await asyncio.to_thread(self._create_session)
+        except BaseException:
+            self._open_sessions -= 1
+            raise
+        self.connected = True
+        return conn
+
+    async def _init_database(self):
+        """Fill the pool with warm sessions"""
+        missing = self.pool_size - self._pool.qsize()
+        conns = await asyncio.gather(*[self._connect() for _ in range(missing)], return_exceptions=True)
+        # gather can also return BaseExceptions such as CancelledError; none of those are sessions
+        errors = [c for c in conns if isinstance(c, BaseException)]
+        for conn in conns:
+            if not isinstance(conn, BaseException):
+                self._pool.put_nowait(conn)
+        if errors:
+            raise errors[0]
+
     def start_init_connection(self):
         """Start database initialization in the background"""
         # Create a task that runs in the background
@@ -46,27 +98,227 @@ class SnowflakeDB:
         self.init_task = loop.create_task(self._init_database())
         return self.init_task
 
-    async def execute_query(self, query: str) -> tuple[list[dict[str, Any]], str]:
-        """Execute a SQL query and return results as a list of dictionaries"""
+    def _discard(self, conn: _PooledSession) -> None:
+        """Close a session in the background and free its pool slot"""
+        self._open_sessions -= 1
+        asyncio.get_running_loop().run_in_executor(None, conn.session.close)
+
+    async def _acquire(self) -> _PooledSession:
+        """Take an idle session from the pool, opening one if none is available
+
+        Callers hold the query semaphore, so the pool never exceeds max_concurrent_queries.
+        """
         # If init_task exists and isn't done, wait for it to complete
         if self.init_task and not self.init_task.done():
             await self.init_task
-        # If session doesn't exist or has expired, initialize it and wait
-        elif not self.session or time.time() - self.auth_time > self.AUTH_EXPIRATION_TIME:
-            await self._init_database()
 
-        logger.debug(f"Executing query: {query}")
+        while not self._pool.empty():
+            conn = self._pool.get_nowait()
+            now = time.monotonic()
+            # Recycle sessions whose authentication may have expired
+            if now - conn.created > self.AUTH_EXPIRATION_TIME:
+                self._discard(conn)
+                continue
+            if now - conn.last_used > self.PING_IDLE_SECONDS:
+                try:
+                    await asyncio.to_thread(conn.session.sql("SELECT 1").collect)
+                except asyncio.CancelledError:
+                    # The ping thread may still be using the session
+                    self._discard(conn)
+                    raise
+                except Exception as e:
+                    logger.warning("Discarding Snowflake session that failed its ping: %s", e)
+                    self._discard(conn)
+                    continue
+            return conn
+
+        return await self._connect()
+
+    @staticmethod
+    def _is_closed(conn: _PooledSession) -> bool:
+        """Whether the session's underlying connection has been closed"""
         try:
-            result = self.session.sql(query).to_pandas()
-            result_rows = result.to_dict(orient="records")
+            return conn.session.connection.is_closed()
+        except Exception:
+            return True
+
+    def _release(self, conn: _PooledSession, error: BaseException | None = None) -> None:
+        """Return a session to the pool, or close it if it is surplus or its connection broke
+
+        Snowpark wraps connector failures, so after an error the connection state is checked
+        rather than the exception type. A session that failed but still looks open is pinged
+        before its next use. Cancelling a caller doesn't stop its worker thread, so a session
+        released on cancellation may still be in use and is always closed.
+        """
+        if (
+            self._pool.full()
+            or isinstance(error, asyncio.CancelledError)
+            or (error is not None and self._is_closed(conn))
+        ):
+            self._discard(conn)
+        else:
+            conn.last_used = float("-inf") if error is not None else time.monotonic()
+            self._pool.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close all idle sessions"""
+        while not self._pool.empty():
+            conn = self._pool.get_nowait()
+            self._open_sessions -= 1
+            await asyncio.to_thread(conn.session.close)
+
+    async def execute_query(
+        self, query: str, params: list | None = None, coalesce: bool = False
+    ) -> tuple[list[dict[str, Any]], str]:
+        """Execute a SQL query and return results as a list of dictionaries
+
+        params are bound to qmark (?) placeholders in the query. With coalesce, concurrent
+        calls for the same query and params share one execution and its result; only use
+        it for read-only queries.
+        """
+        if not coalesce:
+            return await self._execute_query(query, params)
+
+        key = repr((query, params))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute_query(query, params))
+            # Past the bound, queries still run, just without being shared
+            if len(self._inflight) < self.MAX_INFLIGHT_KEYS:
+                self._inflight[key] = task
+                task.add_done_callback(lambda t: self._inflight_done(key, t))
+        # Shielded so one caller going away doesn't cancel the query for the others
+        return await asyncio.shield(task)
+
+    def _inflight_done(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished shared query, retrieving its exception in case every caller left"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _execute_query(self, query: str, params: list | None) -> tuple[list[dict[str, Any]], str]:
+        logger.debug("Executing query: %s", query)
+        try:
+            async with self._query_semaphore:
+                conn = await self._acquire()
+                error = None
+                try:
+                    # Run the blocking Snowpark call on the default executor so the event loop stays free
+                    result_rows = await asyncio.to_thread(self._fetch_rows, conn.session, query, params)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    self._release(conn, error)
             data_id = str(uuid.uuid4())
 
             return result_rows, data_id
 
         except Exception as e:
-            logger.error(f'Database error executing "{query}": {e}')
+            logger.error('Database error executing "%s": %s', query, e)
             raise
 
+    def stream_query(self, query: str, params: list | None = None) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Execute a SQL query and yield results in batches of dictionaries
+
+        Batches follow Snowflake's result chunks, so only one chunk is held in memory at a time.
+        """
+        return self._stream(query, params, self._start_batches, self._next_rows)
+
+    def stream_arrow(self, query: str, params: list | None = None) -> AsyncGenerator["pa.Table", None]:
+        """Execute a SQL query and yield results as Arrow tables, one per Snowflake result chunk
+
+        Tables come straight from the connector, typed from Snowflake's result metadata. An empty
+        result yields a single empty table, so the schema is always available.
+        """
+        return self._stream(query, params, self._arrow_tables, self._next_table)
+
+    async def _stream(
+        self,
+        query: str,
+        params: list | None,
+        start: Callable[[Any, str, list | None], Iterator],
+        next_batch: Callable[[Iterator], Any],
+    ) -> AsyncGenerator:
+        """Run start(session, query, params), then yield next_batch(result) until it returns None
+
+        Both run off the event loop.
+        """
+        logger.debug("Streaming query: %s", query)
+        try:
+            async with self._query_semaphore:
+                conn = await self._acquire()
+                error = None
+                try:
+                    batches = await asyncio.to_thread(start, conn.session, query, params)
+                    while (batch := await asyncio.to_thread(next_batch, batches)) is not None:
+                        yield batch
+                except GeneratorExit:
+                    # Closed between batches, so no thread is using the session
+                    raise
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    self._release(conn, error)
+
+        except Exception as e:
+            logger.error('Database error streaming "%s": %s', query, e)
+            raise
+
+    @property
+    def in_flight_queries(self) -> int:
+        """Number of queries currently holding a concurrency slot"""
+        return self.max_concurrent_queries - self._query_semaphore._value
+
+    @property
+    def pool_stats(self) -> dict[str, int]:
+        """Open, idle and in-use session counts"""
+        idle = self._pool.qsize()
+        return {"size": self._open_sessions, "idle": idle, "in_use": self._open_sessions - idle}
+
+    @staticmethod
+    def _fetch_rows(session, query: str, params: list | None) -> list[dict[str, Any]]:
+        """Run a query synchronously and convert the result to a list of dictionaries"""
+        return session.sql(query, params=params).to_pandas().to_dict(orient="records")
+
+    @staticmethod
+    def _start_batches(session, query: str, params: list | None) -> Iterator:
+        """Run a query synchronously and return an iterator over its pandas result batches"""
+        return iter(session.sql(query, params=params).to_pandas_batches())
+
+    @staticmethod
+    def _arrow_tables(session, query: str, params: list | None) -> Iterator["pa.Table"]:
+        """Run a query and iterate over its result chunks as Arrow tables (lazily, on first next())
+
+        Snowpark binds the parameters and runs the query; the connector cursor then fetches
+        the result by query id in Arrow format, without a pandas round trip.
+        """
+        query_id = session.sql(query, params=params).collect_nowait().query_id
+        cursor = session.connection.cursor()
+        try:
+            cursor.get_results_from_sfqid(query_id)
+            empty = True
+            for table in cursor.fetch_arrow_batches():
+                empty = False
+                yield table
+            if empty:
+                yield cursor.fetch_arrow_all(force_return_table=True)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _next_table(tables: Iterator["pa.Table"]) -> "pa.Table | None":
+        """Fetch the next Arrow table, or None when exhausted"""
+        return next(tables, None)
+
+    @staticmethod
+    def _next_rows(batches: Iterator) -> list[dict[str, Any]] | None:
+        """Fetch the next result batch as a list of dictionaries, or None when exhausted"""
+        batch = next(batches, None)
+        return None if batch is None else batch.to_dict(orient="records")
+
     def add_insight(self, insight: str) -> None:
         """Add a new insight to the collection"""
         self.insights.append(insight)
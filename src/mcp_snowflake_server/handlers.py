@@ -0,0 +1,210 @@
+"""Metadata lookups shared by the MCP tools and HTTP endpoints of the HTTP server."""
+import asyncio
+import hashlib
+import os
+import re
+import time
+import weakref
+from functools import lru_cache
+from typing import Any
+
+import sqlparse
+
+from .db_client import SnowflakeDB
+
+# Query results cache: key -> (expiry, data, data_id). INFORMATION_SCHEMA lookups
+# are cached for CACHE_TTL_SECONDS; read_query results only when READ_QUERY_CACHE_TTL > 0.
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "60"))
+READ_QUERY_CACHE_TTL = float(os.getenv("READ_QUERY_CACHE_TTL", "0"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "512"))
+_META_CACHE: dict[bytes, tuple[float, Any, str]] = {}
+_META_LOCKS: "weakref.WeakValueDictionary[bytes, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Fixed query text with bound identifiers/values, so Snowflake can reuse compiled plans
+_LIST_DATABASES_SQL = "SELECT DATABASE_NAME FROM INFORMATION_SCHEMA.DATABASES"
+_LIST_SCHEMAS_SQL = "SELECT SCHEMA_NAME FROM IDENTIFIER(?)"
+_LIST_TABLES_SQL = """
+    SELECT table_catalog, table_schema, table_name, comment
+    FROM IDENTIFIER(?)
+    WHERE table_schema = ?
+"""
+_DESCRIBE_TABLE_SQL = """
+    SELECT column_name, column_default, is_nullable, data_type, comment
+    FROM IDENTIFIER(?)
+    WHERE table_schema = ? AND table_name = ?
+"""
+# Unquoted identifier, and fully qualified unquoted table name: database.schema.table
+_IDENT_RE = re.compile(r"\A[A-Za-z_][\w$]*\Z")
+_TABLE_RE = re.compile(r"\A([A-Za-z_][\w$]*)\.([A-Za-z_][\w$]*)\.([A-Za-z_][\w$]*)\Z")
+
+# describe_table output key -> INFORMATION_SCHEMA.COLUMNS column
+_DESCRIBE_FIELDS = (
+    ("name", "COLUMN_NAME"),
+    ("default", "COLUMN_DEFAULT"),
+    ("is_nullable", "IS_NULLABLE"),
+    ("data_type", "DATA_TYPE"),
+    ("comment", "COMMENT"),
+)
+
+
+def normalize_sql(query: str) -> str:
+    """Canonical form of a query for cache keys: upper-case keywords, no comments, collapsed whitespace.
+
+    String literals and quoted identifiers are left untouched.
+    """
+    # Whitespace is collapsed in a second pass so gaps left by removed comments go too
+    stripped = sqlparse.format(query, keyword_case="upper", strip_comments=True)
+    return sqlparse.format(stripped, strip_whitespace=True)
+
+
+def _cache_key(query: str, params: list | None) -> bytes:
+    return hashlib.blake2b(repr((query, params)).encode(), digest_size=16).digest()
+
+
+async def cached_query(
+    db: SnowflakeDB,
+    query: str,
+    params: list | None = None,
+    ttl: float = CACHE_TTL_SECONDS,
+    cache_query: str | None = None,
+) -> tuple[Any, str]:
+    """Execute a query, serving repeats from an in-process TTL cache.
+
+    Entries are keyed on cache_query (defaults to query) and params. Concurrent
+    misses for the same key share one lock so only a single request goes to
+    Snowflake. The oldest entries are evicted beyond CACHE_MAX_ENTRIES. A
+    non-positive ttl disables caching.
+    """
+    if ttl <= 0:
+        return await db.execute_query(query, params, coalesce=True)
+
+    key = _cache_key(cache_query or query, params)
+    entry = _META_CACHE.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1], entry[2]
+
+    lock = _META_LOCKS.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _META_LOCKS[key] = lock
+
+    async with lock:
+        entry = _META_CACHE.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1], entry[2]
+
+        data, data_id = await db.execute_query(query, params, coalesce=True)
+        _META_CACHE.pop(key, None)
+        _META_CACHE[key] = (time.monotonic() + ttl, data, data_id)
+        while len(_META_CACHE) > CACHE_MAX_ENTRIES:
+            del _META_CACHE[next(iter(_META_CACHE))]
+        return data, data_id
+
+
+async def read_query(db: SnowflakeDB, query: str) -> tuple[Any, str]:
+    """Run a read-only query, cached by its canonical text when READ_QUERY_CACHE_TTL is set.
+
+    Identical concurrent calls share one execution either way.
+    """
+    if READ_QUERY_CACHE_TTL <= 0:
+        return await db.execute_query(query, coalesce=True)
+    return await cached_query(db, query, ttl=READ_QUERY_CACHE_TTL, cache_query=normalize_sql(query))
+
+
+def parse_identifier(name: str) -> str:
+    """Validate an unquoted identifier (e.g. a database name) and return it upper-cased."""
+    if not _IDENT_RE.match(name):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return name.upper()
+
+
+@lru_cache(maxsize=1024)
+def parse_table_name(table_name: str) -> tuple[str, str, str]:
+    """Validate 'database.schema.table' and return its upper-cased parts."""
+    match = _TABLE_RE.match(table_name)
+    if match is None:
+        raise ValueError("Table name must be fully qualified as 'database.schema.table'")
+    database_name, schema_name, tbl_name = match.groups()
+    return database_name.upper(), schema_name.upper(), tbl_name.upper()
+
+
+async def list_databases(db: SnowflakeDB) -> dict:
+    """List all databases."""
+    data, data_id = await cached_query(db, _LIST_DATABASES_SQL)
+    return {"databases": data, "data_id": data_id}
+
+
+async def list_schemas(db: SnowflakeDB, database: str) -> dict:
+    """List schemas in a database."""
+    if not database:
+        raise ValueError("Missing required 'database' parameter")
+
+    data, data_id = await cached_query(
+        db, _LIST_SCHEMAS_SQL, [f"{parse_identifier(database)}.INFORMATION_SCHEMA.SCHEMATA"]
+    )
+    return {"database": database, "schemas": data, "data_id": data_id}
+
+
+async def list_tables(db: SnowflakeDB, database: str, schema: str | list[str]) -> dict:
+    """List tables in a schema, or in each of a list of schemas concurrently."""
+    if not database or not schema:
+        raise ValueError("Missing required 'database' and 'schema' parameters")
+
+    if isinstance(schema, list):
+        results = await asyncio.gather(*[list_tables(db, database, s) for s in schema])
+        return {"database": database, "schemas": results}
+
+    data, data_id = await cached_query(
+        db, _LIST_TABLES_SQL, [f"{parse_identifier(database)}.INFORMATION_SCHEMA.TABLES", schema.upper()]
+    )
+    return {"database": database, "schema": schema, "tables": data, "data_id": data_id}
+
+
+async def describe_table(db: SnowflakeDB, table_name: str) -> dict:
+    """Describe the columns of a fully qualified table.
+
+    Columns are returned column-oriented, one list per attribute
+    (name, default, is_nullable, data_type, comment), in matching order.
+    """
+    if not table_name:
+        raise ValueError("Missing required 'table_name' parameter")
+
+    database_name, schema_name, tbl_name = parse_table_name(table_name)
+
+    data, data_id = await cached_query(
+        db, _DESCRIBE_TABLE_SQL, [f"{database_name}.INFORMATION_SCHEMA.COLUMNS", schema_name, tbl_name]
+    )
+    return {
+        "database": database_name,
+        "schema": schema_name,
+        "table": tbl_name,
+        "columns": {key: [row.get(field) for row in data] for key, field in _DESCRIBE_FIELDS},
+        "data_id": data_id,
+    }
+
+
+async def batch_describe_tables(db: SnowflakeDB, table_names: list[str]) -> dict:
+    """Describe several tables concurrently.
+
+    Results are in input order; a table that fails is reported as {"table_name": ..., "error": ...}.
+    """
+    if not table_names or not isinstance(table_names, list):
+        raise ValueError("Missing required 'table_names' list")
+
+    results = await asyncio.gather(*[describe_table(db, t) for t in table_names], return_exceptions=True)
+    return {
+        "tables": [
+            {"table_name": t, "error": str(r)} if isinstance(r, Exception) else r
+            for t, r in zip(table_names, results)
+        ]
+    }
+
+
+# Metadata operations by MCP tool name
+METADATA_HANDLERS = {
+    "list_databases": list_databases,
+    "list_schemas": list_schemas,
+    "list_tables": list_tables,
+    "describe_table": describe_table,
+    "batch_describe_tables": batch_describe_tables,
+}
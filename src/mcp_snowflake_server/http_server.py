@@ -1,30 +1,99 @@
 """HTTP wrapper for MCP Snowflake Server for DataRobot deployment."""
 import argparse
-import json
+import asyncio
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator
 
 import dotenv
-import snowflake.connector
+import orjson
 from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response, StreamingResponse
 from starlette.routing import Route
+from starlette.types import ASGIApp, Receive, Scope, Send
 import uvicorn
 
+from . import handlers
 from .db_client import SnowflakeDB
 from .write_detector import SQLWriteDetector
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
+# The format doesn't use thread/process fields, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger("mcp_snowflake_http_server")
 
+# Load environment variables once; worker processes inherit them
+if not os.getenv("_DOTENV_LOADED"):
+    dotenv.load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values orjson does not handle natively (pandas Timestamps, Decimals)."""
+    # Results come from pandas, so it is already loaded here. NaT is a date instance,
+    # so the null markers are checked first.
+    import pandas as pd
+
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as JSON bytes with orjson."""
+    return orjson.dumps(
+        content,
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
 # Global database client
 db_client: SnowflakeDB = None
 write_detector: SQLWriteDetector = None
 
+# The default executor serves blocking Snowflake calls
+DB_THREADS = int(os.getenv("DB_THREADS", "32"))
+
+# Queries wait up to DB_READY_TIMEOUT seconds for the startup connection; /health
+# reports 503 if no session has opened HEALTH_GRACE_SECONDS after startup
+DB_READY_TIMEOUT = float(os.getenv("DB_READY_TIMEOUT", "5"))
+HEALTH_GRACE_SECONDS = float(os.getenv("HEALTH_GRACE_SECONDS", "60"))
+
+_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+# Request bodies above MAX_BODY_BYTES are rejected with 413 instead of being buffered
+MAX_BODY_BYTES = int(os.getenv("MAX_BODY_BYTES", str(1024 * 1024)))
+_BODY_TOO_LARGE = b'{"error":"body too large"}'
+
 
 def init_db_client():
     """Initialize database client and write detector."""
@@ -35,15 +104,12 @@ def init_db_client():
 
     logger.info("Initializing database client")
 
-    # Load environment variables
-    dotenv.load_dotenv()
-
-    default_connection_args = snowflake.connector.connection.DEFAULT_CONFIGURATION
+    # Imported here so worker processes only pay for the connector when initializing
+    from snowflake.connector.connection import DEFAULT_CONFIGURATION
 
+    # One getenv per connector option
     connection_args_from_env = {
-        k: os.getenv("SNOWFLAKE_" + k.upper())
-        for k in default_connection_args
-        if os.getenv("SNOWFLAKE_" + k.upper()) is not None
+        k: v for k in DEFAULT_CONFIGURATION if (v := os.getenv("SNOWFLAKE_" + k.upper())) is not None
     }
 
     # Handle token authentication
@@ -57,17 +123,42 @@ def init_db_client():
     if "schema" not in connection_args_from_env:
         raise ValueError("SNOWFLAKE_SCHEMA environment variable is required")
 
-    logger.info(f"Connecting to Snowflake database: {connection_args_from_env.get('database')}")
-    logger.info(f"Using schema: {connection_args_from_env.get('schema')}")
+    logger.info("Connecting to Snowflake database: %s", connection_args_from_env.get("database"))
+    logger.info("Using schema: %s", connection_args_from_env.get("schema"))
 
     # Initialize database client
-    db_client = SnowflakeDB(connection_args_from_env)
-    db_client.start_init_connection()
+    db_client = SnowflakeDB(
+        connection_args_from_env,
+        max_concurrent_queries=int(os.getenv("SNOWFLAKE_MAX_CONCURRENT", "15")),
+        pool_size=int(os.getenv("SNOWFLAKE_POOL_SIZE", "10")),
+    )
 
     # Initialize write detector
     write_detector = SQLWriteDetector()
 
-    logger.info("Database connection initialized successfully")
+
+async def _warmup(ready: asyncio.Event):
+    """Open the Snowflake session pool in the background, then signal that warmup finished.
+
+    ready is set even if warmup fails so queries stop waiting; /health checks whether
+    a session actually opened.
+    """
+    try:
+        await db_client.start_init_connection()
+        logger.info("Database connection initialized successfully")
+    except Exception as e:
+        # Queries will retry the connection themselves and surface the error
+        logger.error("Error initializing database connection: %s", e)
+    finally:
+        ready.set()
+
+
+async def wait_db_ready():
+    """Wait briefly for the startup warmup before issuing a query."""
+    try:
+        await asyncio.wait_for(app.state.db_ready.wait(), timeout=DB_READY_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise RuntimeError("Snowflake connection is not ready yet, retry shortly")
 
 
 # MCP Tools definition for JSON-RPC endpoint
@@ -101,7 +192,11 @@ MCP_TOOLS = [
             "type": "object",
             "properties": {
                 "database": {"type": "string", "description": "Database name"},
-                "schema": {"type": "string", "description": "Schema name"},
+                "schema": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "Schema name, or a list of schema names to list concurrently",
+                },
             },
             "required": ["database", "schema"],
         },
@@ -120,6 +215,21 @@ MCP_TOOLS = [
             "required": ["table_name"],
         },
     },
+    {
+        "name": "batch_describe_tables",
+        "description": "Get the schema information for several tables at once",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "table_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Fully qualified table names in the format 'database.schema.table'",
+                },
+            },
+            "required": ["table_names"],
+        },
+    },
     {
         "name": "read_query",
         "description": "Execute a SELECT query",
@@ -134,192 +244,352 @@ MCP_TOOLS = [
 ]
 
 
-async def mcp_endpoint(request: Request) -> Response:
-    """MCP JSON-RPC endpoint for Streamable HTTP transport."""
-    try:
-        init_db_client()
-        data = await request.json()
-
-        jsonrpc = data.get("jsonrpc", "2.0")
-        method = data.get("method")
-        params = data.get("params", {})
-        request_id = data.get("id")
-
-        result = None
-        error = None
-
-        if method == "initialize":
-            result = {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "tools": {"listChanged": False},
-                },
-                "serverInfo": {
-                    "name": "snowflake-mcp-server",
-                    "version": "0.4.0",
-                },
-            }
+# Immutable results for initialize and tools/list, serialized once; only the id varies per call
+_INIT_TAIL = orjson.dumps({
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {"listChanged": False},
+    },
+    "serverInfo": {
+        "name": "snowflake-mcp-server",
+        "version": "0.4.0",
+    },
+})
+_TOOLS_LIST_TAIL = orjson.dumps({"tools": MCP_TOOLS})
 
-        elif method == "tools/list":
-            result = {"tools": MCP_TOOLS}
 
-        elif method == "tools/call":
-            tool_name = params.get("name")
-            arguments = params.get("arguments", {})
+def _static_result(request_id: Any, result: bytes) -> bytes:
+    """JSON-RPC response body around a pre-serialized result."""
+    return b'{"jsonrpc":"2.0","id":' + orjson.dumps(request_id) + b',"result":' + result + b"}"
 
-            try:
-                tool_result = await execute_mcp_tool(tool_name, arguments)
-                result = {
-                    "content": [
-                        {"type": "text", "text": tool_result}
-                    ]
-                }
-            except Exception as e:
-                result = {
-                    "content": [
-                        {"type": "text", "text": f"Error: {str(e)}"}
-                    ],
-                    "isError": True
-                }
 
-        elif method == "notifications/initialized":
-            # This is a notification, no response needed
-            return Response(status_code=204)
+async def _handle_initialize(request_id: Any, params: dict) -> bytes:
+    return _static_result(request_id, _INIT_TAIL)
 
-        else:
-            error = {
-                "code": -32601,
-                "message": f"Method not found: {method}"
-            }
 
-        response_data = {"jsonrpc": jsonrpc, "id": request_id}
-        if error:
-            response_data["error"] = error
-        else:
-            response_data["result"] = result
+async def _handle_tools_list(request_id: Any, params: dict) -> bytes:
+    return _static_result(request_id, _TOOLS_LIST_TAIL)
 
-        return JSONResponse(response_data)
 
+async def _handle_tools_call(request_id: Any, params: dict) -> bytes:
+    """Run a tool; tool failures are reported in the result with isError rather than as JSON-RPC errors."""
+    tool_name = params.get("name")
+    arguments = params.get("arguments", {})
+
+    try:
+        tool_result = await execute_mcp_tool(tool_name, arguments)
+        result = {
+            "content": [
+                {"type": "text", "text": tool_result}
+            ]
+        }
     except Exception as e:
-        logger.error(f"Error in MCP endpoint: {e}")
-        return JSONResponse({
-            "jsonrpc": "2.0",
-            "id": None,
-            "error": {
-                "code": -32603,
-                "message": str(e)
-            }
-        }, status_code=500)
-
-
-async def execute_mcp_tool(tool_name: str, arguments: dict) -> str:
-    """Execute an MCP tool and return the result as JSON string."""
-    if tool_name == "list_databases":
-        query = "SELECT DATABASE_NAME FROM INFORMATION_SCHEMA.DATABASES"
-        data, data_id = await db_client.execute_query(query)
-        return json.dumps({"databases": data, "data_id": data_id})
+        result = {
+            "content": [
+                {"type": "text", "text": f"Error: {str(e)}"}
+            ],
+            "isError": True
+        }
+
+    return dumps({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+
+async def _handle_initialized(request_id: Any, params: dict) -> None:
+    # This is a notification, no response needed
+    return None
+
+
+# JSON-RPC method name -> handler(request_id, params) returning the response body,
+# or None for notifications (answered with 204)
+_MCP_METHODS = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+    "notifications/initialized": _handle_initialized,
+}
+
+
+async def _read_body(scope: Scope, receive: Receive) -> bytes | None:
+    """Collect the full request body from ASGI receive messages.
+
+    Returns None as soon as the declared or received size exceeds MAX_BODY_BYTES.
+    """
+    for name, value in scope["headers"]:
+        if name == b"content-length" and int(value) > MAX_BODY_BYTES:
+            return None
+
+    chunks = []
+    size = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+def _body_too_large() -> Response:
+    return Response(_BODY_TOO_LARGE, status_code=413, media_type="application/json")
+
+
+class MCPEndpoint:
+    """MCP JSON-RPC endpoint for Streamable HTTP transport.
+
+    /mcp is the hot path, so this is a bare ASGI app: it reads and writes ASGI
+    messages directly instead of building Request and Response objects.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        status = 200
+        try:
+            raw = await _read_body(scope, receive)
+            if raw is None:
+                await _body_too_large()(scope, receive, send)
+                return
+            data = orjson.loads(raw)
+
+            method = data.get("method")
+            request_id = data.get("id")
+
+            handler = _MCP_METHODS.get(method)
+            if handler is None:
+                body = dumps({
+                    "jsonrpc": data.get("jsonrpc", "2.0"),
+                    "id": request_id,
+                    "error": {
+                        "code": -32601,
+                        "message": f"Method not found: {method}"
+                    }
+                })
+            else:
+                body = await handler(request_id, data.get("params", {}))
+
+        except Exception as e:
+            logger.error("Error in MCP endpoint: %s", e)
+            status = 500
+            body = dumps({
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32603,
+                    "message": str(e)
+                }
+            })
 
-    elif tool_name == "list_schemas":
-        database = arguments.get("database")
-        if not database:
-            raise ValueError("Missing required 'database' parameter")
-        query = f"SELECT SCHEMA_NAME FROM {database.upper()}.INFORMATION_SCHEMA.SCHEMATA"
-        data, data_id = await db_client.execute_query(query)
-        return json.dumps({"database": database, "schemas": data, "data_id": data_id})
-
-    elif tool_name == "list_tables":
-        database = arguments.get("database")
-        schema = arguments.get("schema")
-        if not database or not schema:
-            raise ValueError("Missing required 'database' and 'schema' parameters")
-        query = f"""
-            SELECT table_catalog, table_schema, table_name, comment
-            FROM {database}.information_schema.tables
-            WHERE table_schema = '{schema.upper()}'
-        """
-        data, data_id = await db_client.execute_query(query)
-        return json.dumps({
-            "database": database,
-            "schema": schema,
-            "tables": data,
-            "data_id": data_id
-        })
+        if body is None:
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+            return
 
-    elif tool_name == "describe_table":
-        table_name = arguments.get("table_name")
-        if not table_name:
-            raise ValueError("Missing required 'table_name' parameter")
-
-        split_identifier = table_name.split(".")
-        if len(split_identifier) < 3:
-            raise ValueError("Table name must be fully qualified as 'database.schema.table'")
-
-        database_name = split_identifier[0].upper()
-        schema_name = split_identifier[1].upper()
-        tbl_name = split_identifier[2].upper()
-
-        query = f"""
-            SELECT column_name, column_default, is_nullable, data_type, comment
-            FROM {database_name}.information_schema.columns
-            WHERE table_schema = '{schema_name}' AND table_name = '{tbl_name}'
-        """
-        data, data_id = await db_client.execute_query(query)
-        return json.dumps({
-            "database": database_name,
-            "schema": schema_name,
-            "table": tbl_name,
-            "columns": data,
-            "data_id": data_id
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", b"%d" % len(body))],
         })
+        await send({"type": "http.response.body", "body": body})
 
-    elif tool_name == "read_query":
-        query = arguments.get("query")
-        if not query:
-            raise ValueError("Missing required 'query' parameter")
 
-        if write_detector.analyze_query(query)["contains_write"]:
-            raise ValueError("Calls to read_query should not contain write operations")
+mcp_endpoint = MCPEndpoint()
 
-        data, data_id = await db_client.execute_query(query)
-        return json.dumps({
-            "data": data,
-            "data_id": data_id,
-            "row_count": len(data) if isinstance(data, list) else 0
-        })
 
-    else:
+async def _tool_read_query(arguments: dict) -> dict:
+    """Run a read-only query after rejecting statements that write."""
+    query = arguments.get("query")
+    if not query:
+        raise ValueError("Missing required 'query' parameter")
+
+    # sqlparse is pure Python and slow on large queries, so only parse off the event loop,
+    # and only when a write keyword appears at all
+    if write_detector.may_contain_write(query) and (
+        await asyncio.to_thread(write_detector.analyze_query, query)
+    )["contains_write"]:
+        raise ValueError("Calls to read_query should not contain write operations")
+
+    data, data_id = await handlers.read_query(db_client, query)
+    return {
+        "data": data,
+        "data_id": data_id,
+        "row_count": len(data) if isinstance(data, list) else 0
+    }
+
+
+# MCP tool name -> handler(arguments) returning the tool's JSON payload
+_TOOL_HANDLERS = {
+    "list_databases": lambda args: handlers.list_databases(db_client),
+    "list_schemas": lambda args: handlers.list_schemas(db_client, args.get("database")),
+    "list_tables": lambda args: handlers.list_tables(db_client, args.get("database"), args.get("schema")),
+    "describe_table": lambda args: handlers.describe_table(db_client, args.get("table_name")),
+    "batch_describe_tables": lambda args: handlers.batch_describe_tables(db_client, args.get("table_names")),
+    "read_query": _tool_read_query,
+}
+
+
+async def execute_mcp_tool(tool_name: str | None, arguments: dict) -> str:
+    """Execute an MCP tool and return the result as JSON string."""
+    handler = _TOOL_HANDLERS.get(tool_name) if tool_name else None
+    if handler is None:
         raise ValueError(f"Unknown tool: {tool_name}")
 
+    await wait_db_ready()
+    return dumps(await handler(arguments)).decode()
+
+
+# Probe responses are constant, so they are built once and reused
+_HEALTH_RESPONSE = Response(b'{"status":"healthy","service":"mcp-snowflake-server"}', media_type="application/json")
+_UNAVAILABLE_RESPONSE = Response(
+    b'{"status":"unavailable","service":"mcp-snowflake-server"}', status_code=503, media_type="application/json"
+)
+
 
 async def health_check(request: Request) -> Response:
     """Health check endpoint for DataRobot."""
-    return JSONResponse({"status": "healthy", "service": "mcp-snowflake-server"})
+    if not db_client.connected and time.monotonic() - request.app.state.started_at > HEALTH_GRACE_SECONDS:
+        return _UNAVAILABLE_RESPONSE
+
+    return _HEALTH_RESPONSE
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Expose Snowflake query concurrency for tuning SNOWFLAKE_MAX_CONCURRENT."""
+    if db_client is None:
+        return ORJSONResponse({"in_flight": 0, "max_concurrent": 0})
+
+    return ORJSONResponse({
+        "in_flight": db_client.in_flight_queries,
+        "max_concurrent": db_client.max_concurrent_queries,
+        "pool": db_client.pool_stats,
+    })
+
+
+async def _primed(batches: AsyncGenerator) -> AsyncIterator:
+    """Run a streaming query up to its first batch and return an iterator over all batches.
+
+    Called before the response starts, so query and connection errors can still be
+    reported with an error status instead of a truncated 200.
+    """
+    first = await anext(batches, None)
+
+    async def chain() -> AsyncIterator:
+        try:
+            if first is not None:
+                yield first
+                async for batch in batches:
+                    yield batch
+        finally:
+            # Releases the query slot and session even if the client goes away mid-stream
+            await batches.aclose()
+
+    return chain()
+
+
+async def _ndjson_rows(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """Encode row batches as newline-delimited JSON, one row per line."""
+    async for rows in batches:
+        yield b"".join([dumps(row) + b"\n" for row in rows])
+
+
+class _ChunkSink:
+    """Write-only file object that hands back what was written since the last drain."""
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _stream_schema(schema: "pa.Schema") -> "pa.Schema":
+    """Widen integer columns to int64 so every result chunk fits the first chunk's schema.
+
+    Snowflake picks the integer width of NUMBER(p,0) columns per result chunk.
+    """
+    import pyarrow as pa
+
+    for i, field in enumerate(schema):
+        if pa.types.is_integer(field.type):
+            schema = schema.set(i, field.with_type(pa.int64()))
+    return schema
+
+
+async def _arrow_ipc(tables: AsyncIterator["pa.Table"]) -> AsyncIterator[bytes]:
+    """Encode Arrow tables as one IPC stream; the schema message comes from the first table."""
+    import pyarrow as pa
+
+    sink = _ChunkSink()
+    writer = schema = None
+    async for table in tables:
+        if writer is None:
+            schema = _stream_schema(table.schema)
+            writer = pa.ipc.new_stream(sink, schema)
+        writer.write_table(table.cast(schema))
+        yield sink.drain()
+    if writer is not None:
+        writer.close()
+        yield sink.drain()
 
 
 async def execute_query_endpoint(request: Request) -> Response:
     """Execute a SQL query endpoint."""
     try:
-        data = await request.json()
+        body = await _read_body(request.scope, request.receive)
+        if body is None:
+            return _body_too_large()
+
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return ORJSONResponse({"error": "invalid json"}, status_code=400)
+
         query = data.get("query")
 
         if not query:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"error": "Missing 'query' parameter"},
                 status_code=400
             )
 
+        await wait_db_ready()
+
+        # Stream rows as Arrow IPC or newline-delimited JSON when the client asks for it
+        accept = request.headers.get("accept", "")
+        if _ARROW_STREAM in accept:
+            tables = await _primed(db_client.stream_arrow(query))
+            return StreamingResponse(_arrow_ipc(tables), media_type=_ARROW_STREAM)
+        if "application/x-ndjson" in accept:
+            rows = await _primed(db_client.stream_query(query))
+            return StreamingResponse(_ndjson_rows(rows), media_type="application/x-ndjson")
+
         # Execute query
         results, data_id = await db_client.execute_query(query)
 
-        return JSONResponse({
+        content = {
             "data": results,
             "data_id": data_id,
             "row_count": len(results) if isinstance(results, list) else 0
-        })
+        }
+
+        return ORJSONResponse(content)
 
     except Exception as e:
-        logger.error(f"Error executing query: {e}")
-        return JSONResponse(
+        logger.error("Error executing query: %s", e)
+        return ORJSONResponse(
             {"error": str(e)},
             status_code=500
         )
@@ -328,17 +598,12 @@ async def execute_query_endpoint(request: Request) -> Response:
 async def list_databases_endpoint(request: Request) -> Response:
     """List all databases."""
     try:
-        query = "SELECT DATABASE_NAME FROM INFORMATION_SCHEMA.DATABASES"
-        results, data_id = await db_client.execute_query(query)
-
-        return JSONResponse({
-            "databases": results,
-            "data_id": data_id
-        })
+        await wait_db_ready()
+        return ORJSONResponse(await handlers.list_databases(db_client))
 
     except Exception as e:
-        logger.error(f"Error listing databases: {e}")
-        return JSONResponse(
+        logger.error("Error listing databases: %s", e)
+        return ORJSONResponse(
             {"error": str(e)},
             status_code=500
         )
@@ -350,23 +615,22 @@ async def list_schemas_endpoint(request: Request) -> Response:
         database = request.query_params.get("database")
 
         if not database:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"error": "Missing 'database' parameter"},
                 status_code=400
             )
 
-        query = f"SELECT SCHEMA_NAME FROM {database.upper()}.INFORMATION_SCHEMA.SCHEMATA"
-        results, data_id = await db_client.execute_query(query)
+        try:
+            handlers.parse_identifier(database)
+        except ValueError as e:
+            return ORJSONResponse({"error": str(e)}, status_code=400)
 
-        return JSONResponse({
-            "database": database,
-            "schemas": results,
-            "data_id": data_id
-        })
+        await wait_db_ready()
+        return ORJSONResponse(await handlers.list_schemas(db_client, database))
 
     except Exception as e:
-        logger.error(f"Error listing schemas: {e}")
-        return JSONResponse(
+        logger.error("Error listing schemas: %s", e)
+        return ORJSONResponse(
             {"error": str(e)},
             status_code=500
         )
@@ -379,28 +643,22 @@ async def list_tables_endpoint(request: Request) -> Response:
         schema = request.query_params.get("schema")
 
         if not database or not schema:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"error": "Missing 'database' or 'schema' parameter"},
                 status_code=400
             )
 
-        query = f"""
-            SELECT table_catalog, table_schema, table_name, comment
-            FROM {database}.information_schema.tables
-            WHERE table_schema = '{schema.upper()}'
-        """
-        results, data_id = await db_client.execute_query(query)
+        try:
+            handlers.parse_identifier(database)
+        except ValueError as e:
+            return ORJSONResponse({"error": str(e)}, status_code=400)
 
-        return JSONResponse({
-            "database": database,
-            "schema": schema,
-            "tables": results,
-            "data_id": data_id
-        })
+        await wait_db_ready()
+        return ORJSONResponse(await handlers.list_tables(db_client, database, schema))
 
     except Exception as e:
-        logger.error(f"Error listing tables: {e}")
-        return JSONResponse(
+        logger.error("Error listing tables: %s", e)
+        return ORJSONResponse(
             {"error": str(e)},
             status_code=500
         )
@@ -412,77 +670,148 @@ async def describe_table_endpoint(request: Request) -> Response:
         table_name = request.query_params.get("table")
 
         if not table_name:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"error": "Missing 'table' parameter (format: database.schema.table)"},
                 status_code=400
             )
 
-        split_identifier = table_name.split(".")
-        if len(split_identifier) < 3:
-            return JSONResponse(
-                {"error": "Table name must be fully qualified as 'database.schema.table'"},
+        try:
+            handlers.parse_table_name(table_name)
+        except ValueError as e:
+            return ORJSONResponse({"error": str(e)}, status_code=400)
+
+        await wait_db_ready()
+        return ORJSONResponse(await handlers.describe_table(db_client, table_name))
+
+    except Exception as e:
+        logger.error("Error describing table: %s", e)
+        return ORJSONResponse(
+            {"error": str(e)},
+            status_code=500
+        )
+
+
+async def _run_batch_item(item: dict) -> dict:
+    """Dispatch a single batch sub-request to its handler."""
+    arguments = dict(item)
+    op = arguments.pop("op", None)
+    handler = handlers.METADATA_HANDLERS.get(op)
+    if handler is None:
+        raise ValueError(f"Unknown op: {op}")
+    return await handler(db_client, **arguments)
+
+
+async def batch_endpoint(request: Request) -> Response:
+    """Run several metadata lookups concurrently in a single round trip.
+
+    Body: {"requests": [{"op": "list_tables", "database": "...", "schema": "..."}, ...]}
+    Each result is either the handler's payload or {"error": "..."}, in request order.
+    """
+    try:
+        body = await _read_body(request.scope, request.receive)
+        if body is None:
+            return _body_too_large()
+
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return ORJSONResponse({"error": "invalid json"}, status_code=400)
+
+        reqs = data.get("requests")
+
+        if not isinstance(reqs, list):
+            return ORJSONResponse(
+                {"error": "Missing 'requests' list"},
                 status_code=400
             )
 
-        database_name = split_identifier[0].upper()
-        schema_name = split_identifier[1].upper()
-        table_name = split_identifier[2].upper()
-
-        query = f"""
-            SELECT column_name, column_default, is_nullable, data_type, comment
-            FROM {database_name}.information_schema.columns
-            WHERE table_schema = '{schema_name}' AND table_name = '{table_name}'
-        """
-        results, data_id = await db_client.execute_query(query)
+        await wait_db_ready()
+        results = await asyncio.gather(*[_run_batch_item(r) for r in reqs], return_exceptions=True)
 
-        return JSONResponse({
-            "database": database_name,
-            "schema": schema_name,
-            "table": table_name,
-            "columns": results,
-            "data_id": data_id
+        return ORJSONResponse({
+            "results": [{"error": str(r)} if isinstance(r, Exception) else r for r in results]
         })
 
     except Exception as e:
-        logger.error(f"Error describing table: {e}")
-        return JSONResponse(
+        logger.error("Error executing batch: %s", e)
+        return ORJSONResponse(
             {"error": str(e)},
             status_code=500
         )
 
 
 async def startup():
-    """Initialize database connection on startup."""
+    """Initialize database connection and worker pool on startup."""
     logger.info("Starting MCP Snowflake HTTP Server")
+    logger.info("Event loop: %s", type(asyncio.get_running_loop()).__module__)
+
+    # Blocking Snowflake calls run on the default executor; size it for concurrent queries
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=DB_THREADS))
+
+    # The client is created here only; request handlers rely on it existing.
+    # Startup runs once per worker, so no per-request guard is needed.
     init_db_client()
 
+    # Connect in the background so the server starts serving /health immediately
+    app.state.started_at = time.monotonic()
+    app.state.db_ready = asyncio.Event()
+    app.state.warmup_task = asyncio.create_task(_warmup(app.state.db_ready))
+
 
 async def shutdown():
     """Cleanup on shutdown."""
     global db_client
     logger.info("Shutting down server")
     if db_client:
-        # Close database connections if needed
-        pass
+        await db_client.close()
 
 
-# Define routes
+# Define routes. Starlette matches in list order, so the hot paths come first:
+# the MCP JSON-RPC endpoint, then health probes, then the REST API.
 routes = [
-    Route("/", health_check, methods=["GET"]),
+    # MCP JSON-RPC endpoint for Streamable HTTP transport; a class instance endpoint
+    # is called as a raw ASGI app, so no Request/Response objects are built
+    Route("/mcp", mcp_endpoint, methods=["POST"]),
     Route("/health", health_check, methods=["GET"]),
+    Route("/", health_check, methods=["GET"]),
     Route("/api/query", execute_query_endpoint, methods=["POST"]),
     Route("/api/databases", list_databases_endpoint, methods=["GET"]),
     Route("/api/schemas", list_schemas_endpoint, methods=["GET"]),
     Route("/api/tables", list_tables_endpoint, methods=["GET"]),
     Route("/api/table/describe", describe_table_endpoint, methods=["GET"]),
-    # MCP JSON-RPC endpoint for Streamable HTTP transport
-    Route("/mcp", mcp_endpoint, methods=["POST"]),
+    Route("/api/batch", batch_endpoint, methods=["POST"]),
+    Route("/metrics", metrics_endpoint, methods=["GET"]),
 ]
 
+
+async def server_error_handler(request: Request, exc: Exception) -> Response:
+    """Render unhandled exceptions as a compact JSON error."""
+    logger.error("Unhandled error: %s", exc)
+    return ORJSONResponse({"error": str(exc)}, status_code=500)
+
+
+class CompressionMiddleware:
+    """GZip responses, except NDJSON and Arrow streams, which must reach the client batch by batch."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 5):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"accept" and (b"application/x-ndjson" in value or b"vnd.apache.arrow" in value):
+                    return await self.app(scope, receive, send)
+            return await self.gzip(scope, receive, send)
+        await self.app(scope, receive, send)
+
+
 # Create Starlette app
 app = Starlette(
-    debug=True,
+    debug=os.getenv("MCP_DEBUG", "0") == "1",
     routes=routes,
+    middleware=[Middleware(CompressionMiddleware, minimum_size=1024, compresslevel=5)],
+    exception_handlers={Exception: server_error_handler},
     on_startup=[startup],
     on_shutdown=[shutdown],
 )
@@ -495,13 +824,19 @@ def main():
     parser.add_argument("--port", type=int, default=8080, help="Port to bind to")
     args = parser.parse_args()
 
-    logger.info(f"Starting server on {args.host}:{args.port}")
+    logger.info("Starting server on %s:%s", args.host, args.port)
+
+    # Multiple workers need the app as an import string so each process can load it
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
 
     uvicorn.run(
-        app,
+        app if workers == 1 else "mcp_snowflake_server.http_server:app",
         host=args.host,
         port=args.port,
         log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
     )
 
 
@@ -43,7 +43,7 @@ def handle_tool_errors(func: Callable) -> Callable:
         try:
             return await func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
+            logger.error("Error in %s: %s", func.__name__, e)
             return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
     return wrapper
@@ -100,8 +100,8 @@ async def handle_list_schemas(arguments, db, *_, exclusion_config=None):
         raise ValueError("Missing required 'database' parameter")
 
     database = arguments["database"]
-    query = f"SELECT SCHEMA_NAME FROM {database.upper()}.INFORMATION_SCHEMA.SCHEMATA"
-    data, data_id = await db.execute_query(query)
+    query = "SELECT SCHEMA_NAME FROM IDENTIFIER(?)"
+    data, data_id = await db.execute_query(query, [f"{database.upper()}.INFORMATION_SCHEMA.SCHEMATA"])
 
     # Filter out excluded schemas
     if exclusion_config and "schemas" in exclusion_config and exclusion_config["schemas"]:
@@ -141,12 +141,12 @@ async def handle_list_tables(arguments, db, *_, exclusion_config=None):
     database = arguments["database"]
     schema = arguments["schema"]
 
-    query = f"""
+    query = """
         SELECT table_catalog, table_schema, table_name, comment 
-        FROM {database}.information_schema.tables 
-        WHERE table_schema = '{schema.upper()}'
+        FROM IDENTIFIER(?) 
+        WHERE table_schema = ?
     """
-    data, data_id = await db.execute_query(query)
+    data, data_id = await db.execute_query(query, [f"{database}.information_schema.tables", schema.upper()])
 
     # Filter out excluded tables
     if exclusion_config and "tables" in exclusion_config and exclusion_config["tables"]:
@@ -195,12 +195,14 @@ async def handle_describe_table(arguments, db, *_):
     schema_name = split_identifier[1].upper()
     table_name = split_identifier[2].upper()
 
-    query = f"""
+    query = """
         SELECT column_name, column_default, is_nullable, data_type, comment 
-        FROM {database_name}.information_schema.columns 
-        WHERE table_schema = '{schema_name}' AND table_name = '{table_name}'
+        FROM IDENTIFIER(?) 
+        WHERE table_schema = ? AND table_name = ?
     """
-    data, data_id = await db.execute_query(query)
+    data, data_id = await db.execute_query(
+        query, [f"{database_name}.information_schema.columns", schema_name, table_name]
+    )
 
     output = {
         "type": "data",
@@ -280,15 +282,17 @@ async def prefetch_tables(db: SnowflakeDB, credentials: dict) -> dict:
     try:
         logger.info("Prefetching table descriptions")
         table_results, data_id = await db.execute_query(
-            f"""SELECT table_name, comment 
-                FROM {credentials['database']}.information_schema.tables 
-                WHERE table_schema = '{credentials['schema'].upper()}'"""
+            """SELECT table_name, comment 
+                FROM IDENTIFIER(?) 
+                WHERE table_schema = ?""",
+            [f"{credentials['database']}.information_schema.tables", credentials["schema"].upper()],
         )
 
         column_results, data_id = await db.execute_query(
-            f"""SELECT table_name, column_name, data_type, comment 
-                FROM {credentials['database']}.information_schema.columns 
-                WHERE table_schema = '{credentials['schema'].upper()}'"""
+            """SELECT table_name, column_name, data_type, comment 
+                FROM IDENTIFIER(?) 
+                WHERE table_schema = ?""",
+            [f"{credentials['database']}.information_schema.columns", credentials["schema"].upper()],
         )
 
         tables_brief = {}
@@ -303,7 +307,7 @@ async def prefetch_tables(db: SnowflakeDB, credentials: dict) -> dict:
         return tables_brief
 
     except Exception as e:
-        logger.error(f"Error prefetching table descriptions: {e}")
+        logger.error("Error prefetching table descriptions: %s", e)
         return f"Error prefetching table descriptions: {e}"
 
 
@@ -336,9 +340,9 @@ async def main(
         try:
             with open(config_file, "r") as f:
                 config = json.load(f)
-                logger.info(f"Loaded configuration from {config_file}")
+                logger.info("Loaded configuration from %s", config_file)
         except Exception as e:
-            logger.error(f"Error loading configuration file: {e}")
+            logger.error("Error loading configuration file: %s", e)
 
     # Merge exclude_patterns from parameters with config file
     exclusion_config = config.get("exclude_patterns", {})
@@ -359,7 +363,7 @@ async def main(
         if key not in exclusion_config:
             exclusion_config[key] = []
 
-    logger.info(f"Exclusion patterns: {exclusion_config}")
+    logger.info("Exclusion patterns: %s", exclusion_config)
 
     db = SnowflakeDB(connection_args)
     db.start_init_connection()
@@ -553,7 +557,7 @@ async def main(
     @server.list_tools()
     async def handle_list_tools() -> list[types.Tool]:
         logger.info("Listing tools")
-        logger.error(f"Allowed tools: {allowed_tools}")
+        logger.error("Allowed tools: %s", allowed_tools)
         tools = [
             types.Tool(
                 name=tool.name,
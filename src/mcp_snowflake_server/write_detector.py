@@ -1,3 +1,5 @@
+import re
+
 import sqlparse
 from sqlparse.sql import Token, TokenList
 from sqlparse.tokens import Keyword, DML, DDL
@@ -16,6 +18,14 @@ class SQLWriteDetector:
         # Combine all write keywords
         self.write_keywords = self.dml_write_keywords | self.ddl_keywords | self.dcl_keywords
 
+        # Matches wherever any write keyword appears as a substring; a query with no match
+        # cannot be flagged by the token analysis below, so it skips parsing entirely
+        self._write_keyword_re = re.compile("|".join(sorted(self.write_keywords)), re.IGNORECASE)
+
+    def may_contain_write(self, sql_query: str) -> bool:
+        """Cheap pre-check: False means analyze_query would certainly report no writes."""
+        return self._write_keyword_re.search(sql_query) is not None
+
     def analyze_query(self, sql_query: str) -> Dict:
         """
         Analyze a SQL query to determine if it contains write operations.
@@ -27,7 +37,7 @@ class SQLWriteDetector:
             Dictionary containing analysis results
         """
         # Parse the SQL query
-        parsed = sqlparse.parse(sql_query)
+        parsed = sqlparse.parse(sql_query) if self.may_contain_write(sql_query) else None
         if not parsed:
             return {"contains_write": False, "write_operations": set(), "has_cte_write": False}
 